@@ -1,12 +1,13 @@
 import os
-import sys
 import getpass
 import re
 import hou
 import shutil
 import platform
+import struct
 import subprocess
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from PySide2 import QtWidgets, QtCore, QtGui
 from PySide2.QtWidgets import QLabel, QMessageBox
@@ -22,9 +23,11 @@ except Exception:
 
 
 class DeadlineJobLoader(QtCore.QThread):
-    job_loaded = QtCore.Signal(dict)
+    jobs_batch_loaded = QtCore.Signal(list)
     finished_loading = QtCore.Signal()
 
+    BATCH_SIZE = 25
+
     def __init__(self, deadline_cmd, user):
         super().__init__()
         self.deadline_cmd = deadline_cmd
@@ -32,43 +35,285 @@ class DeadlineJobLoader(QtCore.QThread):
 
     def run(self):
         try:
-            # If deadline command missing extension on Windows, try .exe
-            if platform.system() == "Windows" and not self.deadline_cmd.lower().endswith(".exe"):
-                if os.path.isfile(self.deadline_cmd + ".exe"):
-                    self.deadline_cmd = self.deadline_cmd + ".exe"
-
             if not os.path.isfile(self.deadline_cmd):
                 # Still continue; the subprocess will likely error but we catch it
                 pass
 
-            result = subprocess.run(
+            # Stream stdout and hand jobs to the UI in batches as they are parsed
+            proc = subprocess.Popen(
                 [self.deadline_cmd, "GetJobsFilter", f"Username={self.user}"],
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True
             )
-            output = result.stdout.strip().splitlines()
-
+            batch = []
             job = {}
-            for line in output:
+            for line in proc.stdout:
                 line = line.strip()
                 if line == "":
                     if job:
-                        self.job_loaded.emit(job)
+                        batch.append(job)
                         job = {}
+                        if len(batch) >= self.BATCH_SIZE:
+                            self.jobs_batch_loaded.emit(batch)
+                            batch = []
                 else:
                     if "=" in line:
                         key, value = line.split("=", 1)
                         job[key.strip()] = value.strip()
+            proc.wait()
             if job:
-                self.job_loaded.emit(job)
+                batch.append(job)
+            if batch:
+                self.jobs_batch_loaded.emit(batch)
         except Exception as e:
             print("Error loading Deadline jobs:", e)
         finally:
             self.finished_loading.emit()
 
+PROGRESS_ROLE = QtCore.Qt.UserRole + 1
+RENDER_IMAGE_EXTS = (".exr", ".jpg", ".jpeg", ".png", ".dpx", ".tif", ".tiff")
+
+
+class ProgressDelegate(QtWidgets.QStyledItemDelegate):
+    # Paints a progress bar from item data instead of one QProgressBar widget per row
+    def paint(self, painter, option, index):
+        progress = index.data(PROGRESS_ROLE)
+        if progress is None:
+            super().paint(painter, option, index)
+            return
+        opt = QtWidgets.QStyleOptionProgressBar()
+        opt.rect = option.rect.adjusted(2, 2, -2, -2)
+        opt.minimum = 0
+        opt.maximum = 100
+        opt.progress = progress
+        opt.text = f"{progress}%"
+        opt.textVisible = True
+        opt.textAlignment = QtCore.Qt.AlignCenter
+        QtWidgets.QApplication.style().drawControl(QtWidgets.QStyle.CE_ProgressBar, opt, painter)
+
+
+DEADLINE_COLUMNS = [
+    "Job Name", "User", "Progress", "Status", "Frames", "Pool",
+    "Priority", "Submitted", "Started", "Completed",
+    "Output Directory", "Output File", "Submitted From", "Job ID"
+]
+
+
+class DeadlineJobsModel(QtCore.QAbstractTableModel):
+    # Rows index into the shared job list; cells come from each job's precomputed "__row"
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._jobs = []
+        self._filtered = []
+        self._sort = None
+
+    def set_jobs(self, jobs, filtered):
+        self.beginResetModel()
+        self._jobs = jobs
+        self._filtered = filtered
+        self._apply_sort()
+        self.endResetModel()
+
+    def job_id(self, row):
+        if 0 <= row < len(self._filtered):
+            return self._jobs[self._filtered[row]].get("__parsed_jobid")
+        return None
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._filtered)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(DEADLINE_COLUMNS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return DEADLINE_COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        job = self._jobs[self._filtered[index.row()]]
+        col = index.column()
+        if role == QtCore.Qt.DisplayRole:
+            # progress stays numeric for sorting; ProgressDelegate paints it
+            return job["__progress"] if col == 2 else job["__row"][col]
+        if role == PROGRESS_ROLE and col == 2:
+            return job["__progress"]
+        if role == QtCore.Qt.TextAlignmentRole:
+            return QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter if col == 0 else QtCore.Qt.AlignCenter
+        if role == QtCore.Qt.UserRole:
+            return job["__parsed_jobid"]
+        return None
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        self._sort = (column, order)
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        old_jobs = [self._filtered[i.row()] for i in old_indexes]
+        self._apply_sort()
+        rows = {job_index: row for row, job_index in enumerate(self._filtered)}
+        self.changePersistentIndexList(
+            old_indexes,
+            [self.index(rows[j], i.column()) for i, j in zip(old_indexes, old_jobs)])
+        self.layoutChanged.emit()
+
+    def _apply_sort(self):
+        if self._sort is None:
+            return
+        column, order = self._sort
+        jobs = self._jobs
+        if column == 2:
+            key = lambda i: jobs[i]["__progress"]
+        else:
+            key = lambda i: jobs[i]["__row"][column]
+        self._filtered.sort(key=key, reverse=order == QtCore.Qt.DescendingOrder)
+
+
+class _WorkerSignals(QtCore.QObject):
+    progress = QtCore.Signal(object)
+    ready = QtCore.Signal(object)
+
+
+class _Worker(QtCore.QRunnable):
+    # Runs fn(report, *args) on a QThreadPool thread; report() payloads and the
+    # return value are delivered to the UI thread through signals
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = _WorkerSignals()
+
+    def run(self):
+        result = None
+        try:
+            result = self.fn(self.signals.progress.emit, *self.args)
+        except Exception as e:
+            print("Background task error:", e)
+        finally:
+            self.signals.ready.emit(result)
+
+
 def get_default_base_path():
     return r"\\spdata\PROJECTS_TEMP"
+
+
+def get_deadline_cmd(is_windows):
+    deadline_bin_dir = os.getenv("DEADLINE_PATH", r"C:\Program Files\Thinkbox\Deadline10\bin")
+    deadline_cmd = os.path.join(deadline_bin_dir, "deadlinecommand")
+    # If deadline command missing extension on Windows, try .exe
+    if is_windows and os.path.isfile(deadline_cmd + ".exe"):
+        deadline_cmd += ".exe"
+    return deadline_cmd
+
+
+def _read_png_size(f):
+    hdr = f.read(24)
+    if len(hdr) < 24 or hdr[:8] != b"\x89PNG\r\n\x1a\n" or hdr[12:16] != b"IHDR":
+        return None
+    return struct.unpack(">II", hdr[16:24])
+
+
+def _read_jpeg_size(f):
+    if f.read(2) != b"\xff\xd8":
+        return None
+    while True:
+        byte = f.read(1)
+        while byte and byte != b"\xff":
+            byte = f.read(1)
+        while byte == b"\xff":
+            byte = f.read(1)
+        if not byte:
+            return None
+        marker = byte[0]
+        # Standalone markers carry no length field
+        if marker == 0x01 or 0xD0 <= marker <= 0xD9:
+            continue
+        seg = f.read(2)
+        if len(seg) < 2:
+            return None
+        length = struct.unpack(">H", seg)[0]
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            data = f.read(5)
+            if len(data) < 5:
+                return None
+            h, w = struct.unpack(">HH", data[1:5])
+            return w, h
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def _read_exr_size(f):
+    hdr = f.read(8)
+    if len(hdr) < 8 or hdr[:4] != b"\x76\x2f\x31\x01":
+        return None
+    # Attributes: name\0 type\0 int32 size, value; header ends with an empty name
+    while True:
+        name = b""
+        while True:
+            c = f.read(1)
+            if not c:
+                return None
+            if c == b"\0":
+                break
+            name += c
+        if not name:
+            return None
+        attr_type = b""
+        while True:
+            c = f.read(1)
+            if not c:
+                return None
+            if c == b"\0":
+                break
+            attr_type += c
+        size = struct.unpack("<i", f.read(4))[0]
+        if name == b"dataWindow" and attr_type == b"box2i" and size == 16:
+            xmin, ymin, xmax, ymax = struct.unpack("<iiii", f.read(16))
+            return xmax - xmin + 1, ymax - ymin + 1
+        f.seek(size, os.SEEK_CUR)
+
+
+_HEADER_READERS = {
+    ".png": _read_png_size,
+    ".jpg": _read_jpeg_size,
+    ".jpeg": _read_jpeg_size,
+    ".exr": _read_exr_size,
+}
+
+
+def read_header_resolution(path):
+    # Parse width/height straight from the file header for known formats
+    reader = _HEADER_READERS.get(os.path.splitext(path)[1].lower())
+    if reader is None:
+        return None
+    try:
+        with open(path, "rb") as f:
+            size = reader(f)
+    except (OSError, struct.error):
+        return None
+    if not size:
+        return None
+    return f"{size[0]}x{size[1]}"
+
+
+def read_image_resolution(path):
+    # Parses the PNG/JPEG/EXR header directly and only falls back to OIIO for other
+    # formats; runs on worker threads, where each call opens its own ImageInput
+    resolution = read_header_resolution(path)
+    if resolution:
+        return resolution
+    resolution = "Unknown"
+    try:
+        if HAS_OIIO:
+            img = oiio.ImageInput.open(path)
+            if img:
+                spec = img.spec()
+                resolution = f"{spec.width}x{spec.height}"
+                img.close()
+    except Exception:
+        resolution = "Unknown"
+    return resolution
     
 class HoudiniManager(QtWidgets.QMainWindow):
     def __init__(self):
@@ -76,6 +321,15 @@ class HoudiniManager(QtWidgets.QMainWindow):
         self.setWindowTitle("Houdini Manager")
         self.setMinimumSize(1000, 600)
         self.settings = QSettings("MyStudio", "HoudiniManager")
+        # Process-invariant values, resolved once instead of per call
+        self._username = getpass.getuser()
+        system = platform.system()
+        self._is_windows = system == "Windows"
+        self._is_darwin = system == "Darwin"
+        self.deadline_cmd = get_deadline_cmd(self._is_windows)
+        # path -> (dir mtime_ns, direct file paths, subdirectory paths)
+        self._size_cache = {}
+        self._exr_generation = 0
         # Load stored base path or fallback to default
         self.base_sp_path = self.settings.value("browser/base_path", get_default_base_path())
         self.setup_ui()
@@ -109,7 +363,7 @@ class HoudiniManager(QtWidgets.QMainWindow):
 
 
         # User info
-        username = getpass.getuser()
+        username = self._username
         user_widget = QtWidgets.QWidget()
         user_layout = QtWidgets.QHBoxLayout(user_widget)
         user_layout.setContentsMargins(4, 4, 4, 4)
@@ -360,6 +614,9 @@ class HoudiniManager(QtWidgets.QMainWindow):
         try:
             if os.path.exists(path):
                 shutil.rmtree(path)
+                prefix = os.path.join(path, "")
+                for cached_path in [p for p in self._size_cache if p == path or p.startswith(prefix)]:
+                    del self._size_cache[cached_path]
                 self.populate_cache_tree()
         except Exception as e:
             print(f"Failed to delete cache folder {path}: {e}")
@@ -406,14 +663,19 @@ class HoudiniManager(QtWidgets.QMainWindow):
 
     def refresh_exr_thumbnails(self):
         self.exr_list.clear()
-        self.exr_folders = []
         self.exr_items = {}
-        self.exr_index = 0
-
+        # Results from an older refresh still in flight are dropped by generation
+        self._exr_generation += 1
         flipbook_root = os.path.normpath(hou.expandString("$HIP/Flipbooks"))
-        if not os.path.exists(flipbook_root):
-            return
+        worker = _Worker(self._scan_exr_disk, flipbook_root)
+        worker.signals.ready.connect(partial(self._apply_exr_folders, self._exr_generation))
+        QtCore.QThreadPool.globalInstance().start(worker)
 
+    def _scan_exr_disk(self, report, flipbook_root):
+        # Runs on a pool thread: plain filesystem work only
+        folders = []
+        if not os.path.exists(flipbook_root):
+            return folders
         for name in sorted(os.listdir(flipbook_root)):
             folder = os.path.join(flipbook_root, name)
             if not os.path.isdir(folder):
@@ -421,31 +683,41 @@ class HoudiniManager(QtWidgets.QMainWindow):
             exrs = sorted([f for f in os.listdir(folder) if f.lower().endswith(".exr")])
             if not exrs:
                 continue
+            folders.append((name, folder, [os.path.join(folder, f) for f in exrs]))
+        return folders
 
-            exr_paths = [os.path.join(folder, f) for f in exrs]
-            self.exr_folders.append((name, folder, exr_paths))
-
-            placeholder = QtGui.QPixmap(160, 90)
-            placeholder.fill(QtGui.QColor("#2a2a2a"))
-            item = QtWidgets.QListWidgetItem(QtGui.QIcon(placeholder), name)
+    def _apply_exr_folders(self, generation, folders):
+        if generation != self._exr_generation or not folders:
+            return
+        placeholder = QtGui.QPixmap(160, 90)
+        placeholder.fill(QtGui.QColor("#2a2a2a"))
+        placeholder_icon = QtGui.QIcon(placeholder)
+        for name, folder, exr_paths in folders:
+            item = QtWidgets.QListWidgetItem(placeholder_icon, name)
             item.setData(QtCore.Qt.UserRole, exr_paths)
             self.exr_list.addItem(item)
             self.exr_items[folder] = item
 
-        self.thumb_timer = QtCore.QTimer()
-        self.thumb_timer.timeout.connect(self.load_next_exr_thumbnail)
-        self.thumb_timer.start(60)
+        worker = _Worker(self._decode_exr_thumbnails, [(folder, paths[0]) for _, folder, paths in folders])
+        worker.signals.progress.connect(partial(self._apply_exr_thumbnail, generation))
+        QtCore.QThreadPool.globalInstance().start(worker)
 
-    def load_next_exr_thumbnail(self):
-        if self.exr_index >= len(self.exr_folders):
-            self.thumb_timer.stop()
-            return
+    def _decode_exr_thumbnails(self, report, targets):
+        # Decode in parallel; each finished QImage is handed to the UI thread via report()
+        paths = [path for _, path in targets]
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as ex:
+            for (folder, _), image in zip(targets, ex.map(self.load_exr_thumbnail, paths)):
+                if image is not None:
+                    report((folder, image))
 
-        name, folder, exr_paths = self.exr_folders[self.exr_index]
-        thumb = self.load_exr_thumbnail(exr_paths[0])
-        if thumb:
-            self.exr_items[folder].setIcon(QtGui.QIcon(thumb))
-        self.exr_index += 1
+    def _apply_exr_thumbnail(self, generation, result):
+        if generation != self._exr_generation:
+            return
+        folder, image = result
+        item = self.exr_items.get(folder)
+        if item:
+            # QPixmap must be created on the UI thread
+            item.setIcon(QtGui.QIcon(QtGui.QPixmap.fromImage(image)))
 
     def load_exr_thumbnail(self, path, size=(160, 90)):
         if not HAS_OIIO:
@@ -474,7 +746,8 @@ class HoudiniManager(QtWidgets.QMainWindow):
                 return None
 
             qimg = QtGui.QImage(img.data, w, h, w * img.shape[2], fmt)
-            return QtGui.QPixmap.fromImage(qimg).scaled(*size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+            # QImage (unlike QPixmap) is safe off the UI thread; copy() detaches it from the numpy buffer
+            return qimg.scaled(*size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation).copy()
         except Exception as e:
             print(f"Thumbnail load failed for {path}: {e}")
             return None
@@ -488,9 +761,9 @@ class HoudiniManager(QtWidgets.QMainWindow):
         mp4_path = os.path.normpath(os.path.expandvars("$HIP/Flipbooks/mp4"))
         os.makedirs(mp4_path, exist_ok=True)
         try:
-            if platform.system() == "Windows":
+            if self._is_windows:
                 os.startfile(mp4_path)
-            elif platform.system() == "Darwin":
+            elif self._is_darwin:
                 subprocess.run(["open", mp4_path])
             else:
                 subprocess.run(["xdg-open", mp4_path])
@@ -791,9 +1064,9 @@ class HoudiniManager(QtWidgets.QMainWindow):
                 path = hou.expandString(path)
             path = os.path.normpath(path)
             if os.path.exists(path):
-                if platform.system() == "Windows":
+                if self._is_windows:
                     os.startfile(path)
-                elif platform.system() == "Darwin":
+                elif self._is_darwin:
                     subprocess.Popen(["open", path])
                 else:
                     subprocess.Popen(["xdg-open", path])
@@ -862,12 +1135,44 @@ class HoudiniManager(QtWidgets.QMainWindow):
         return dict(grouped)
 
     def get_folder_size(self, path):
+        try:
+            return self._walk_size(path)
+        except OSError:
+            return 0
+
+    def _walk_size(self, path):
+        # Per-directory listing, reused while the directory mtime is unchanged (adding,
+        # removing or renaming entries bumps it). Files are re-stat'd every walk since
+        # rewriting a file in place, e.g. re-caching the same frames, leaves it untouched.
+        mtime_ns = os.stat(path).st_mtime_ns
+        cached = self._size_cache.get(path)
         total = 0
-        for dirpath, _, filenames in os.walk(path):
-            for f in filenames:
-                fp = os.path.join(dirpath, f)
-                if os.path.isfile(fp):
-                    total += os.path.getsize(fp)
+        if cached and cached[0] == mtime_ns:
+            files, subdirs = cached[1], cached[2]
+            for f in files:
+                try:
+                    total += os.stat(f).st_size
+                except OSError:
+                    pass
+        else:
+            # Fresh listing: DirEntry.stat() is already paid for (free on Windows/SMB)
+            files, subdirs = [], []
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.is_file():
+                            total += entry.stat().st_size
+                            files.append(entry.path)
+                    except OSError:
+                        pass
+            self._size_cache[path] = (mtime_ns, files, subdirs)
+        for sub in subdirs:
+            try:
+                total += self._walk_size(sub)
+            except OSError:
+                pass
         return total
 
     def human_readable_size(self, size, decimal_places=1):
@@ -907,21 +1212,27 @@ class HoudiniManager(QtWidgets.QMainWindow):
             render_dir = os.path.join(hip_dir, "render")
             if not os.path.exists(render_dir):
                 return
-            version_folders = sorted([f for f in os.listdir(render_dir) if f.lower().startswith('v') and os.path.isdir(os.path.join(render_dir, f))])
-            row = 0
-            for i, version in enumerate(version_folders):
-                version_path = os.path.join(render_dir, version)
-                layer_folders = sorted(os.listdir(version_path))
-                text_color = QtGui.QColor("#FFFFFF") if i % 2 == 0 else QtGui.QColor("#FFDAB3")
-                for layer in layer_folders:
-                    layer_path = os.path.join(version_path, layer)
-                    if not os.path.isdir(layer_path):
-                        continue
-                    exr_files = [f for f in os.listdir(layer_path) if os.path.splitext(f)[1].lower() in (".exr", ".jpg", ".jpeg", ".png", ".dpx", ".tif", ".tiff")]
-                    if not exr_files:
+            with os.scandir(render_dir) as it:
+                version_folders = sorted(
+                    (e for e in it if e.name.lower().startswith('v') and e.is_dir()),
+                    key=lambda e: e.name)
+            pattern = re.compile(r"^(.*?)(\d+)\.[^.]+$")
+            # Scan folders first, then read all resolutions in parallel
+            layers = []
+            for i, version_entry in enumerate(version_folders):
+                version = version_entry.name
+                with os.scandir(version_entry.path) as it:
+                    layer_folders = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+                for layer_entry in layer_folders:
+                    layer = layer_entry.name
+                    layer_path = layer_entry.path
+                    with os.scandir(layer_path) as it:
+                        exr_entries = sorted(
+                            (e for e in it if os.path.splitext(e.name)[1].lower() in RENDER_IMAGE_EXTS),
+                            key=lambda e: e.name)
+                    if not exr_entries:
                         continue
-                    exr_files.sort()
-                    pattern = re.compile(r"^(.*?)(\d+)\.[^.]+$")
+                    exr_files = [e.name for e in exr_entries]
                     matches = [pattern.match(f) for f in exr_files]
                     frame_range = ""
                     if matches and all(matches):
@@ -930,32 +1241,31 @@ class HoudiniManager(QtWidgets.QMainWindow):
                         frame_range = f"{start}-{end}"
                     else:
                         frame_range = f"1-{len(exr_files)}"
-                    resolution = "Unknown"
-                    try:
-                        if HAS_OIIO:
-                            img = oiio.ImageInput.open(os.path.join(layer_path, exr_files[0]))
-                            if img:
-                                spec = img.spec()
-                                resolution = f"{spec.width}x{spec.height}"
-                                img.close()
-                    except Exception:
-                        resolution = "Unknown"
-                    modified_time = os.path.getmtime(layer_path)
-                    datetime_str = QDateTime.fromSecsSinceEpoch(int(modified_time)).toString("yyyy-MM-dd hh:mm")
-                    user = getpass.getuser()
-                    frame_count = str(len(exr_files))
-                    row_data = [layer, frame_range, frame_count, resolution, version, datetime_str, user]
-                    self.render_table.insertRow(row)
-                    for col, data in enumerate(row_data):
-                        item = QtWidgets.QTableWidgetItem(data)
-                        item.setForeground(text_color)
-                        item.setData(QtCore.Qt.UserRole, layer_path)
-                        if col == 0:
-                            item.setTextAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
-                        else:
-                            item.setTextAlignment(QtCore.Qt.AlignCenter)
-                        self.render_table.setItem(row, col, item)
-                    row += 1
+                    modified_time = layer_entry.stat().st_mtime
+                    layers.append((i, version, layer, layer_path, modified_time, frame_range,
+                                   len(exr_files), exr_entries[0].path))
+
+            first_paths = [l[-1] for l in layers]
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                resolutions = list(ex.map(read_image_resolution, first_paths))
+
+            for row, (layer_info, resolution) in enumerate(zip(layers, resolutions)):
+                i, version, layer, layer_path, modified_time, frame_range, count, _ = layer_info
+                text_color = QtGui.QColor("#FFFFFF") if i % 2 == 0 else QtGui.QColor("#FFDAB3")
+                datetime_str = QDateTime.fromSecsSinceEpoch(int(modified_time)).toString("yyyy-MM-dd hh:mm")
+                user = self._username
+                frame_count = str(count)
+                row_data = [layer, frame_range, frame_count, resolution, version, datetime_str, user]
+                self.render_table.insertRow(row)
+                for col, data in enumerate(row_data):
+                    item = QtWidgets.QTableWidgetItem(data)
+                    item.setForeground(text_color)
+                    item.setData(QtCore.Qt.UserRole, layer_path)
+                    if col == 0:
+                        item.setTextAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
+                    else:
+                        item.setTextAlignment(QtCore.Qt.AlignCenter)
+                    self.render_table.setItem(row, col, item)
             min_widths = [140, 140, 90, 140, 90, 140, 140]
             for col, width in enumerate(min_widths):
                 self.render_table.setColumnWidth(col, width)
@@ -1015,9 +1325,9 @@ class HoudiniManager(QtWidgets.QMainWindow):
             # If image sequences not found, fallback to mp4
             mp4s = [os.path.join(folder, f) for f in os.listdir(folder) if f.lower().endswith(".mp4")]
             if mp4s:
-                if os.name == 'nt':
+                if self._is_windows:
                     os.startfile(mp4s[0])
-                elif sys.platform == 'darwin':
+                elif self._is_darwin:
                     subprocess.Popen(["open", mp4s[0]])
                 else:
                     subprocess.Popen(["xdg-open", mp4s[0]])
@@ -1055,8 +1365,8 @@ class HoudiniManager(QtWidgets.QMainWindow):
         self.user_filter = QtWidgets.QComboBox()
         self.user_filter.setEditable(True)
         self.user_filter.setMinimumWidth(140)
-        self.user_filter.addItem(getpass.getuser())
-        self.user_filter.setCurrentText(getpass.getuser())
+        self.user_filter.addItem(self._username)
+        self.user_filter.setCurrentText(self._username)
         filter_layout.addWidget(QLabel("User:"))
         filter_layout.addWidget(self.user_filter)
 
@@ -1096,19 +1406,16 @@ class HoudiniManager(QtWidgets.QMainWindow):
         left_layout.addLayout(filter_layout)
 
         # Deadline table
-        self.deadline_table = QtWidgets.QTableWidget()
-        self.deadline_table.setColumnCount(14)
-        self.deadline_table.setHorizontalHeaderLabels([
-            "Job Name", "User", "Progress", "Status", "Frames", "Pool",
-            "Priority", "Submitted", "Started", "Completed",
-            "Output Directory", "Output File", "Submitted From", "Job ID"
-        ])
+        self.deadline_model = DeadlineJobsModel(self)
+        self.deadline_table = QtWidgets.QTableView()
+        self.deadline_table.setModel(self.deadline_model)
         self.deadline_table.setSortingEnabled(True)
+        self.deadline_table.setItemDelegateForColumn(2, ProgressDelegate(self.deadline_table))
         self.deadline_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.deadline_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.deadline_table.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.deadline_table.customContextMenuRequested.connect(self.show_deadline_context_menu)
-        self.deadline_table.itemSelectionChanged.connect(self._deadline_row_selected)
+        self.deadline_table.selectionModel().selectionChanged.connect(self._deadline_row_selected)
 
         left_layout.addWidget(self.deadline_table)
 
@@ -1152,6 +1459,12 @@ class HoudiniManager(QtWidgets.QMainWindow):
         self._deadline_timer = QtCore.QTimer()
         self._deadline_timer.timeout.connect(self.load_deadline_jobs)
 
+        # debounce job-info fetches so scrolling the selection spawns one deadlinecommand
+        self._pending_job_id = None
+        self._jobinfo_timer = QtCore.QTimer()
+        self._jobinfo_timer.setSingleShot(True)
+        self._jobinfo_timer.timeout.connect(lambda: self.fetch_and_show_job_info(self._pending_job_id))
+
         return page
 
     def _toggle_deadline_autorefresh(self, state):
@@ -1167,22 +1480,22 @@ class HoudiniManager(QtWidgets.QMainWindow):
         self.search_bar.blockSignals(True)
         self.search_bar.clear()
         # clear table & jobs
-        self.deadline_table.setRowCount(0)
         self.jobs = []
-        # prepare deadline command
-        deadline_bin_dir = os.getenv("DEADLINE_PATH", r"C:\Program Files\Thinkbox\Deadline10\bin")
-        self.deadline_cmd = os.path.join(deadline_bin_dir, "deadlinecommand")
-        if platform.system() == "Windows" and not self.deadline_cmd.lower().endswith(".exe"):
-            if os.path.isfile(self.deadline_cmd + ".exe"):
-                self.deadline_cmd += ".exe"
-        user = self.user_filter.currentText().strip() or getpass.getuser()
+        self.deadline_model.set_jobs(self.jobs, [])
+        user = self.user_filter.currentText().strip() or self._username
         # start loader thread
         self.loader_thread = DeadlineJobLoader(self.deadline_cmd, user)
-        self.loader_thread.job_loaded.connect(self._store_loaded_job_and_add)
+        self.loader_thread.jobs_batch_loaded.connect(self._store_loaded_jobs_and_add)
         self.loader_thread.finished_loading.connect(self._deadline_loader_finished)
         self.loader_thread.start()
 
-    def _store_loaded_job_and_add(self, job):
+    def _store_loaded_jobs_and_add(self, jobs):
+        for job in jobs:
+            self._store_loaded_job(job)
+        # rebuild the table once per batch rather than once per job
+        self.apply_deadline_filter()
+
+    def _store_loaded_job(self, job):
         # store job
         if not hasattr(self, "jobs"):
             self.jobs = []
@@ -1192,12 +1505,13 @@ class HoudiniManager(QtWidgets.QMainWindow):
         # parse submit time into QDate for filtering convenience
         qdate = self._parse_job_submit_date(job.get("JobSubmitDateTime", "") or job.get("JobSubmitDate", ""))
         job["__submit_qdate"] = qdate
+        # lowercase search fields once here instead of on every filter pass
+        job["__lname"] = (job.get("Name", "") or "").lower()
+        job["__luser"] = (job.get("UserName", "") or job.get("User", "") or "").lower()
+        job["__ljobid"] = jobid.lower()
+        # display values are built once here; the model reads them directly
+        job["__row"], job["__progress"] = self._build_deadline_row(job)
         self.jobs.append(job)
-        # add immediately (we'll filter later)
-        # but only add if it matches current filters
-        # (apply_deadline_filter will rebuild entire table incrementally)
-        # simply re-apply filter
-        self.apply_deadline_filter()
 
     def _deadline_loader_finished(self):
         self.search_bar.blockSignals(False)
@@ -1230,9 +1544,7 @@ class HoudiniManager(QtWidgets.QMainWindow):
             pass
         return None
 
-    def add_deadline_job_row(self, job):
-        row = self.deadline_table.rowCount()
-        self.deadline_table.insertRow(row)
+    def _build_deadline_row(self, job):
         name = job.get("Name", "Unknown")
         user = job.get("UserName", "") or job.get("User", "")
         status = job.get("Status", "")
@@ -1241,7 +1553,8 @@ class HoudiniManager(QtWidgets.QMainWindow):
         job_id = job.get("__parsed_jobid", "UNKNOWN")
         # frames parsing
         raw_frames = job.get("Frames", "")
-        frame_numbers = set()
+        # track min/max only; expanding every range into a set is O(frames)
+        lo, hi = None, None
         if isinstance(raw_frames, str):
             parts = re.split(r"[,\s]+", raw_frames.strip())
             for p in parts:
@@ -1249,13 +1562,17 @@ class HoudiniManager(QtWidgets.QMainWindow):
                     try:
                         a, b = p.split("-", 1)
                         a_i, b_i = int(a), int(b)
-                        frame_numbers.update(range(a_i, b_i + 1))
                     except Exception:
-                        pass
+                        continue
+                    if a_i > b_i:
+                        continue
                 elif p.isdigit():
-                    frame_numbers.add(int(p))
-        frame_list = sorted(frame_numbers)
-        frame_range = f"{frame_list[0]}-{frame_list[-1]}" if frame_list else ""
+                    a_i = b_i = int(p)
+                else:
+                    continue
+                lo = a_i if lo is None else min(lo, a_i)
+                hi = b_i if hi is None else max(hi, b_i)
+        frame_range = f"{lo}-{hi}" if lo is not None else ""
         # times
         submit_time = job.get("JobSubmitDateTime", "")
         started_time = job.get("JobStartedDateTime", "")
@@ -1278,34 +1595,20 @@ class HoudiniManager(QtWidgets.QMainWindow):
             priority, submit_time, started_time, completed_time,
             output_dir, output_file, submit_machine, job_id
         ]
-        for i, value in enumerate(columns):
-            if i == 2:
-                progress_bar = QtWidgets.QProgressBar()
-                progress_bar.setValue(progress)
-                progress_bar.setAlignment(QtCore.Qt.AlignCenter)
-                progress_bar.setFormat(f"{progress}%")
-                progress_bar.setFixedHeight(16)
-                self.deadline_table.setCellWidget(row, i, progress_bar)
-            else:
-                item = QtWidgets.QTableWidgetItem(value or "")
-                if i == 0:
-                    item.setTextAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
-                else:
-                    item.setTextAlignment(QtCore.Qt.AlignCenter)
-                item.setData(QtCore.Qt.UserRole, job_id)
-                self.deadline_table.setItem(row, i, item)
+        return [value or "" for value in columns], progress
 
     def apply_deadline_filter(self):
-        # Rebuild table from self.jobs applying search, user, and date filters
+        # Rebuild the model's row list from self.jobs applying search, user, and date filters
         filter_text = self.search_bar.text().lower().strip()
         user_filter_text = (self.user_filter.currentText() or "").lower().strip()
         date_from = self.date_start.date()
         date_to = self.date_end.date()
-        self.deadline_table.setRowCount(0)
-        for job in getattr(self, "jobs", []):
-            name = (job.get("Name", "") or "").lower()
-            user = (job.get("UserName", "") or job.get("User", "") or "").lower()
-            jobid = (job.get("__parsed_jobid", "") or "").lower()
+        jobs = getattr(self, "jobs", [])
+        filtered = []
+        for index, job in enumerate(jobs):
+            name = job["__lname"]
+            user = job["__luser"]
+            jobid = job["__ljobid"]
             # date filtering: if job has __submit_qdate, filter by range; else accept
             submit_qdate = job.get("__submit_qdate", None)
             date_ok = True
@@ -1323,30 +1626,23 @@ class HoudiniManager(QtWidgets.QMainWindow):
                 if filter_text in name or filter_text in user or filter_text in jobid:
                     text_ok = True
             if date_ok and user_ok and text_ok:
-                self.add_deadline_job_row(job)
+                filtered.append(index)
+        self.deadline_model.set_jobs(jobs, filtered)
+
+    def _deadline_row_job_id(self, row):
+        return self.deadline_model.job_id(row)
 
     def get_selected_job_ids(self):
         selected = self.deadline_table.selectionModel().selectedRows()
-        job_ids = set()
-        for row in selected:
-            for col in range(self.deadline_table.columnCount()):
-                item = self.deadline_table.item(row.row(), col)
-                if item and item.data(QtCore.Qt.UserRole):
-                    job_ids.add(item.data(QtCore.Qt.UserRole))
-                    break
-        return list(job_ids)
+        job_ids = {self._deadline_row_job_id(r.row()) for r in selected}
+        return [jid for jid in job_ids if jid]
 
     def show_deadline_context_menu(self, pos):
         index = self.deadline_table.indexAt(pos)
         if not index.isValid():
             return
         self.deadline_table.selectRow(index.row())
-        job_id = None
-        for col in range(self.deadline_table.columnCount()):
-            item = self.deadline_table.item(index.row(), col)
-            if item and item.data(QtCore.Qt.UserRole):
-                job_id = item.data(QtCore.Qt.UserRole)
-                break
+        job_id = self._deadline_row_job_id(index.row())
         if not job_id:
             return
         menu = QtWidgets.QMenu()
@@ -1357,29 +1653,19 @@ class HoudiniManager(QtWidgets.QMainWindow):
         menu.addAction("🛈 View Job Info", lambda jid=job_id: self.fetch_and_show_job_info(jid))
         menu.exec_(self.deadline_table.viewport().mapToGlobal(pos))
 
-    def _deadline_row_selected(self):
+    def _deadline_row_selected(self, *_):
         # when user selects a row, auto-load job info for convenience
         sels = self.deadline_table.selectionModel().selectedRows()
         if not sels:
             return
-        row = sels[0].row()
-        job_id = None
-        for col in range(self.deadline_table.columnCount()):
-            item = self.deadline_table.item(row, col)
-            if item and item.data(QtCore.Qt.UserRole):
-                job_id = item.data(QtCore.Qt.UserRole)
-                break
+        job_id = self._deadline_row_job_id(sels[0].row())
         if job_id:
-            # fetch job info asynchronously to avoid blocking UI
-            QtCore.QTimer.singleShot(10, lambda jid=job_id: self.fetch_and_show_job_info(jid))
+            # restart the debounce; only the final selection fetches job info
+            self._pending_job_id = job_id
+            self._jobinfo_timer.start(250)
 
     def fetch_and_show_job_info(self, job_id):
         try:
-            if not hasattr(self, "deadline_cmd") or not self.deadline_cmd:
-                deadline_bin_dir = os.getenv("DEADLINE_PATH", r"C:\Program Files\Thinkbox\Deadline10\bin")
-                self.deadline_cmd = os.path.join(deadline_bin_dir, "deadlinecommand")
-                if platform.system() == "Windows" and os.path.isfile(self.deadline_cmd + ".exe"):
-                    self.deadline_cmd += ".exe"
             result = subprocess.run([self.deadline_cmd, "GetJob", job_id], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
             out = result.stdout.strip()
             if not out:
@@ -1,8 +1,83 @@
 from PySide2 import QtWidgets, QtCore, QtGui
 from PySide2.QtWidgets import QInputDialog
 import hou
-
-camera_selector_window = None
+import shiboken2
+
+# Applied to the selector window itself, which is built once per session and reused
+_STYLE_QSS = """
+    #CameraSelectorUI, #CameraSelectorUI QWidget {
+        background-color: #121212;
+        color: #e0e0e0;
+        border-radius: 4px;
+        font-family: "Segoe UI", Tahoma, Geneva, Verdana, sans-serif;
+    }
+    #CameraSelectorUI QPushButton {
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        min-width: 110px;
+        font-weight: 500;
+    }
+    #CameraSelectorUI QPushButton#SelectCamera {
+        background-color: #2196F3;
+        color: #fff;
+    }
+    #CameraSelectorUI QPushButton#SelectCamera:hover {
+        background-color: #1976D2;
+    }
+    #CameraSelectorUI QPushButton#RenderNode {
+        background-color: #4CAF50;
+        color: #fff;
+    }
+    #CameraSelectorUI QPushButton#RenderNode:hover {
+        background-color: #388E3C;
+    }
+    #CameraSelectorUI QPushButton#MatteNode {
+        background-color: #9E9E9E;
+        color: #fff;
+    }
+    #CameraSelectorUI QPushButton#MatteNode:hover {
+        background-color: #757575;
+    }
+    #CameraSelectorUI QPushButton#GeoLightNode {
+        background-color: #FF7043;
+        color: #fff;
+    }
+    #CameraSelectorUI QPushButton#GeoLightNode:hover {
+        background-color: #F4511E;
+    }
+    #CameraSelectorUI QPushButton#GenerateLOP {
+        background-color: #FFFFFF;
+        color: #000000;
+        min-width: 150px;
+        font-weight: 600;
+    }
+    #CameraSelectorUI QPushButton#GenerateLOP:hover {
+        background-color: #F0F0F0;
+    }
+    #CameraSelectorUI QPushButton#Reset {
+        background-color: #E53935;
+        color: #fff;
+    }
+    #CameraSelectorUI QPushButton#Reset:hover {
+        background-color: #B71C1C;
+    }
+    #CameraSelectorUI QListView {
+        background-color: #1E1E1E;
+        border: 1px solid #444444;
+        padding: 6px;
+        border-radius: 4px;
+        selection-background-color: #424242;
+        selection-color: #FFFFFF;
+    }
+    #CameraSelectorUI QListView::item:selected {
+        background-color: #424242;
+        color: #FFFFFF;
+    }
+    #CameraSelectorUI QLabel {
+        color: #CCCCCC;
+    }
+"""
 
 
 class CameraSelectorUI(QtWidgets.QWidget):
@@ -11,8 +86,17 @@ class CameraSelectorUI(QtWidgets.QWidget):
     and generating a corresponding LOP network under /stage.
     """
 
+    # (attribute, header text, item color) for each category shown in the node list
+    NODE_SECTIONS = (
+        ("camera_nodes", "Camera Node(s):", "#a3d9ff"),
+        ("render_nodes", "Render Node(s):", "#90ee90"),
+        ("matte_nodes", "Matte Node(s):", "#d3d3d3"),
+        ("geolight_nodes", "GeoLight Node(s):", "#ffbb99"),
+    )
+
     def __init__(self, parent=None):
         super(CameraSelectorUI, self).__init__(parent)
+        self.setObjectName("CameraSelectorUI")
         self.setWindowTitle("Alembic Camera, Render, Matte & GeoLight Node Selector")
         self.setWindowFlags(self.windowFlags() | QtCore.Qt.WindowStaysOnTopHint)
         self.resize(650, 550)
@@ -44,7 +128,12 @@ class CameraSelectorUI(QtWidgets.QWidget):
         button_layout.addWidget(self.get_geolight_nodes_button)
 
         # Node list display
-        self.node_list = QtWidgets.QListWidget()
+        self.node_model = QtGui.QStandardItemModel(self)
+        self.node_list = QtWidgets.QListView()
+        self.node_list.setModel(self.node_model)
+        self.node_list.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.node_list.setUniformItemSizes(True)
+        self.node_list.setLayoutMode(QtWidgets.QListView.Batched)
         self.layout.addLayout(button_layout)
         self.layout.addWidget(self.node_list)
 
@@ -66,142 +155,70 @@ class CameraSelectorUI(QtWidgets.QWidget):
         self.layout.addWidget(self.status_label)
 
         # StyleSheet for colors and layout
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #121212;
-                color: #e0e0e0;
-                border-radius: 4px;
-                font-family: "Segoe UI", Tahoma, Geneva, Verdana, sans-serif;
-            }
-            QPushButton {
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                min-width: 110px;
-                font-weight: 500;
-                transition: background-color 0.3s ease, box-shadow 0.3s ease;
-            }
-            QPushButton#SelectCamera {
-                background-color: #2196F3;
-                color: #fff;
-                box-shadow: 0 2px 6px rgba(33, 150, 243, 0.5);
-            }
-            QPushButton#SelectCamera:hover {
-                background-color: #1976D2;
-                box-shadow: 0 4px 12px rgba(25, 118, 210, 0.7);
-            }
-            QPushButton#RenderNode {
-                background-color: #4CAF50;
-                color: #fff;
-                box-shadow: 0 2px 6px rgba(76, 175, 80, 0.5);
-            }
-            QPushButton#RenderNode:hover {
-                background-color: #388E3C;
-                box-shadow: 0 4px 12px rgba(56, 142, 60, 0.7);
-            }
-            QPushButton#MatteNode {
-                background-color: #9E9E9E;
-                color: #fff;
-                box-shadow: 0 2px 6px rgba(158, 158, 158, 0.5);
-            }
-            QPushButton#MatteNode:hover {
-                background-color: #757575;
-                box-shadow: 0 4px 12px rgba(117, 117, 117, 0.7);
-            }
-            QPushButton#GeoLightNode {
-                background-color: #FF7043;
-                color: #fff;
-                box-shadow: 0 2px 6px rgba(255, 112, 67, 0.5);
-            }
-            QPushButton#GeoLightNode:hover {
-                background-color: #F4511E;
-                box-shadow: 0 4px 12px rgba(244, 81, 30, 0.7);
-            }
-            QPushButton#GenerateLOP {
-                background-color: #FFFFFF;
-                color: #000000;
-                min-width: 150px;
-                font-weight: 600;
-                box-shadow: 0 2px 8px rgba(255, 255, 255, 0.9);
-                transition: background-color 0.3s ease, box-shadow 0.3s ease;
-            }
-            QPushButton#GenerateLOP:hover {
-                background-color: #F0F0F0;
-                box-shadow: 0 4px 16px rgba(240, 240, 240, 1);
-            }
-            QPushButton#Reset {
-                background-color: #E53935;
-                color: #fff;
-                box-shadow: 0 2px 6px rgba(229, 57, 53, 0.5);
-                transition: background-color 0.3s ease, box-shadow 0.3s ease;
-            }
-            QPushButton#Reset:hover {
-                background-color: #B71C1C;
-                box-shadow: 0 4px 12px rgba(183, 28, 28, 0.7);
-            }
-            QListWidget {
-                background-color: #1E1E1E;
-                border: 1px solid #444444;
-                padding: 6px;
-                border-radius: 4px;
-                selection-background-color: #424242;
-                selection-color: #FFFFFF;
-            }
-            QListWidget::item:selected {
-                background-color: #424242;
-                color: #FFFFFF;
-            }
-            QLabel {
-                color: #CCCCCC;
-            }
-        """)
+        self.setStyleSheet(_STYLE_QSS)
+
 
         # Stored node paths by category
         self.camera_nodes = []
         self.render_nodes = []
         self.matte_nodes = []
         self.geolight_nodes = []
+        # Row count per category in node_model; None until the headers are built
+        self._section_rows = None
 
         self.generated_count = 0
 
     def update_display(self):
-        """Update the QListWidget with current selected nodes grouped by category."""
-        self.node_list.clear()
-
-        def add_header(text):
-            item = QtWidgets.QListWidgetItem(text)
-            font = item.font()
-            font.setBold(True)
-            item.setFont(font)
-            item.setFlags(item.flags() & ~QtCore.Qt.ItemIsSelectable)
-            self.node_list.addItem(item)
-
-        add_header("Camera Node(s):")
-        for cam in self.camera_nodes or ["(none)"]:
-            item = QtWidgets.QListWidgetItem(cam)
-            item.setForeground(QtGui.QColor("#a3d9ff"))
-            self.node_list.addItem(item)
-
-        add_header("Render Node(s):")
-        for ren in self.render_nodes or ["(none)"]:
-            item = QtWidgets.QListWidgetItem(ren)
-            item.setForeground(QtGui.QColor("#90ee90"))
-            self.node_list.addItem(item)
-
-        add_header("Matte Node(s):")
-        for matte in self.matte_nodes or ["(none)"]:
-            item = QtWidgets.QListWidgetItem(matte)
-            item.setForeground(QtGui.QColor("#d3d3d3"))
-            self.node_list.addItem(item)
-
-        add_header("GeoLight Node(s):")
-        for light in self.geolight_nodes or ["(none)"]:
-            item = QtWidgets.QListWidgetItem(light)
-            item.setForeground(QtGui.QColor("#ffbb99"))
-            self.node_list.addItem(item)
+        """Refresh every category section of the node list."""
+        for attr, _, _ in self.NODE_SECTIONS:
+            self._refresh_section(attr)
+
+    def _refresh_section(self, attr):
+        """Update only the rows of one category, reusing existing items where possible."""
+        if self._section_rows is None:
+            # Header rows are created once; each section starts with a "(none)" row
+            self._section_rows = {}
+            for name, title, color in self.NODE_SECTIONS:
+                header = QtGui.QStandardItem(title)
+                font = header.font()
+                font.setBold(True)
+                header.setFont(font)
+                header.setSelectable(False)
+                placeholder = QtGui.QStandardItem("(none)")
+                placeholder.setForeground(QtGui.QColor(color))
+                self.node_model.appendRow(header)
+                self.node_model.appendRow(placeholder)
+                self._section_rows[name] = 1
+
+        start = 0
+        color = None
+        for name, _, section_color in self.NODE_SECTIONS:
+            start += 1  # header row
+            if name == attr:
+                color = section_color
+                break
+            start += self._section_rows[name]
+
+        paths = getattr(self, attr) or ["(none)"]
+        old_count = self._section_rows[attr]
+        for row, text in enumerate(paths[:old_count], start):
+            item = self.node_model.item(row)
+            if item.text() != text:
+                item.setText(text)
+        if len(paths) > old_count:
+            first = start + old_count
+            self.node_model.insertRows(first, len(paths) - old_count)
+            brush = QtGui.QBrush(QtGui.QColor(color))
+            for row, text in enumerate(paths[old_count:], first):
+                item = QtGui.QStandardItem(text)
+                item.setForeground(brush)
+                self.node_model.setItem(row, item)
+        elif len(paths) < old_count:
+            self.node_model.removeRows(start + len(paths), old_count - len(paths))
+        self._section_rows[attr] = len(paths)
 
     def on_select_camera(self):
-        """Recursively find and store all camera nodes under the first selected node."""
+        """Find and store all camera nodes under the first selected node."""
         selected_nodes = hou.selectedNodes()
         if not selected_nodes:
             self.status_label.setText("❌ No node selected.")
@@ -209,16 +226,17 @@ class CameraSelectorUI(QtWidgets.QWidget):
         root = selected_nodes[0]
         cameras = []
 
-        def recursive_search(node):
+        # Iterative pre-order walk; children are pushed reversed to keep hierarchy order
+        stack = [root]
+        while stack:
+            node = stack.pop()
             if node.type().name() == "cam":
                 cameras.append(node.path())
-            for child in node.children():
-                recursive_search(child)
+            stack.extend(reversed(node.children()))
 
-        recursive_search(root)
         self.camera_nodes = cameras
         self.status_label.setText(f"✅ Found {len(cameras)} camera node(s) under {root.path()}")
-        self.update_display()
+        self._refresh_section("camera_nodes")
 
     def on_get_render_nodes(self):
         """Store currently selected nodes as Render nodes."""
@@ -228,7 +246,7 @@ class CameraSelectorUI(QtWidgets.QWidget):
             return
         self.render_nodes = [node.path() for node in selected_nodes]
         self.status_label.setText(f"✅ Stored {len(self.render_nodes)} render node(s)")
-        self.update_display()
+        self._refresh_section("render_nodes")
 
     def on_get_matte_nodes(self):
         """Store currently selected nodes as Matte nodes."""
@@ -238,7 +256,7 @@ class CameraSelectorUI(QtWidgets.QWidget):
             return
         self.matte_nodes = [node.path() for node in selected_nodes]
         self.status_label.setText(f"✅ Stored {len(self.matte_nodes)} matte node(s)")
-        self.update_display()
+        self._refresh_section("matte_nodes")
 
     def on_get_geolight_nodes(self):
         """Store currently selected nodes as GeoLight nodes."""
@@ -248,7 +266,7 @@ class CameraSelectorUI(QtWidgets.QWidget):
             return
         self.geolight_nodes = [node.path() for node in selected_nodes]
         self.status_label.setText(f"✅ Stored {len(self.geolight_nodes)} GeoLight node(s)")
-        self.update_display()
+        self._refresh_section("geolight_nodes")
 
     def on_reset(self):
         """Clear all stored node paths and reset UI."""
@@ -256,7 +274,8 @@ class CameraSelectorUI(QtWidgets.QWidget):
         self.render_nodes.clear()
         self.matte_nodes.clear()
         self.geolight_nodes.clear()
-        self.node_list.clear()
+        self.node_model.clear()
+        self._section_rows = None
         self.status_label.setText("🔄 Reset completed.")
 
     def on_generate_lop(self):
@@ -264,14 +283,6 @@ class CameraSelectorUI(QtWidgets.QWidget):
         Create LOP network nodes under /stage based on stored node paths.
         Asks user for Karma Render Settings node name.
         """
-        def get_unique_name(stage, base_name):
-            count = 1
-            name = base_name
-            while stage.node(name):
-                name = f"{base_name}_{count}"
-                count += 1
-            return name
-
         if not (self.camera_nodes or self.render_nodes or self.matte_nodes or self.geolight_nodes):
             self.status_label.setText("❌ No nodes stored to generate LOPs.")
             return
@@ -281,14 +292,51 @@ class CameraSelectorUI(QtWidgets.QWidget):
             self.status_label.setText("❌ /stage context not found.")
             return
 
+        # Ask before touching the scene so a cancel leaves nothing behind and Houdini
+        # isn't held in Manual mode while the dialog is open
+        custom_name, ok = QInputDialog.getText(
+            self,
+            "Karma Node Name",
+            "Enter name for Karma Render Settings node:",
+            QtWidgets.QLineEdit.Normal,
+            "KarmaRenderSettings"
+        )
+        if not ok or not custom_name.strip():
+            self.status_label.setText("❌ Node creation cancelled. No Karma node name provided.")
+            return
+        karma_name = custom_name.strip()
+
+        # One undo step, and no stage recomposition until every node is wired up
+        prev_mode = hou.updateModeSetting()
+        hou.setUpdateMode(hou.updateMode.Manual)
+        try:
+            with hou.undos.group("Generate LOP"):
+                self._generate_lop_network(stage, karma_name)
+        finally:
+            hou.setUpdateMode(prev_mode)
+
+    def _generate_lop_network(self, stage, karma_name):
+        """Build the LOP nodes for on_generate_lop under the given /stage node."""
+        # Seed once from /stage so name checks are set lookups, not stage.node() calls
+        existing_names = {child.name() for child in stage.children()}
+
+        def get_unique_name(base_name):
+            count = 1
+            name = base_name
+            while name in existing_names:
+                name = f"{base_name}_{count}"
+                count += 1
+            existing_names.add(name)
+            return name
+
         created_nodes = []
         scene_import = None
 
         # Create SceneImport node for cameras
         if self.camera_nodes:
-            node_name = get_unique_name(stage, "SceneImportCamera")
+            node_name = get_unique_name("SceneImportCamera")
             scene_import = stage.createNode("sceneimport", node_name)
-            scene_import.parm("objects").set(" ".join(self.camera_nodes))
+            scene_import.setParms({"objects": " ".join(self.camera_nodes)})
             scene_import.setColor(hou.Color((0.4, 0.7, 1.0)))
             created_nodes.append(scene_import)
 
@@ -296,10 +344,9 @@ class CameraSelectorUI(QtWidgets.QWidget):
         render_sop_nodes = []
         for path in self.render_nodes:
             base_name = path.split("/")[-1]
-            node_name = get_unique_name(stage, base_name)
+            node_name = get_unique_name(base_name)
             sop_node = stage.createNode("sopimport", node_name)
-            sop_node.parm("soppath").set(path)
-            sop_node.parm("copycontents").set(2)
+            sop_node.setParms({"soppath": path, "copycontents": 2})
             sop_node.setColor(hou.Color((0.5, 1.0, 0.5)))
             render_sop_nodes.append(sop_node)
             created_nodes.append(sop_node)
@@ -308,31 +355,29 @@ class CameraSelectorUI(QtWidgets.QWidget):
         matte_geom_settings_nodes = []
         for path in self.matte_nodes:
             base_name = path.split("/")[-1]
-            sop_name = get_unique_name(stage, f"{base_name}_Matte")
-            geom_name = get_unique_name(stage, f"{base_name}_GeoSettings")
+            sop_name = get_unique_name(f"{base_name}_Matte")
+            geom_name = get_unique_name(f"{base_name}_GeoSettings")
 
             sop_node = stage.createNode("sopimport", sop_name)
-            sop_node.parm("soppath").set(path)
-            sop_node.parm("copycontents").set(2)
+            sop_node.setParms({"soppath": path, "copycontents": 2})
             sop_node.setColor(hou.Color((0.8, 0.8, 0.8)))
 
             geom_settings = stage.createNode("rendergeometrysettings", geom_name)
             geom_settings.setInput(0, sop_node)
             geom_settings.setColor(hou.Color((0.8, 0.8, 0.8)))
 
-            primpattern_parm = geom_settings.parm("primpattern")
-            if primpattern_parm:
-                primpattern_parm.set("%type:Boundable")
-
-            ctrl = geom_settings.parm("xn__primvarskarmaobjectholdoutmode_control_02bfg")
+            # setParms() raises on unknown names, so only include parms this build has
+            parms = {}
+            if geom_settings.parm("primpattern"):
+                parms["primpattern"] = "%type:Boundable"
+            if geom_settings.parm("xn__primvarskarmaobjectholdoutmode_control_02bfg"):
+                parms["xn__primvarskarmaobjectholdoutmode_control_02bfg"] = "set"
             mode = geom_settings.parm("xn__primvarskarmaobjectholdoutmode_zpbfg")
-            if ctrl:
-                ctrl.set("set")
             if mode:
                 labels = mode.menuLabels()
-                items = mode.menuItems()
                 if "Matte" in labels:
-                    mode.set(items[labels.index("Matte")])
+                    parms[mode.name()] = mode.menuItems()[labels.index("Matte")]
+            geom_settings.setParms(parms)
 
             created_nodes.extend([sop_node, geom_settings])
             matte_geom_settings_nodes.append(geom_settings)
@@ -341,27 +386,26 @@ class CameraSelectorUI(QtWidgets.QWidget):
         geolight_geom_settings_nodes = []
         for path in self.geolight_nodes:
             base_name = path.split("/")[-1]
-            sop_name = get_unique_name(stage, f"{base_name}_GeoLight")
-            geom_name = get_unique_name(stage, f"{base_name}_GeoLightSettings")
+            sop_name = get_unique_name(f"{base_name}_GeoLight")
+            geom_name = get_unique_name(f"{base_name}_GeoLightSettings")
 
             sop_node = stage.createNode("sopimport", sop_name)
-            sop_node.parm("soppath").set(path)
-            sop_node.parm("copycontents").set(2)
+            sop_node.setParms({"soppath": path, "copycontents": 2})
             sop_node.setColor(hou.Color((1.0, 0.6, 0.4)))
 
             geom_settings = stage.createNode("rendergeometrysettings", geom_name)
             geom_settings.setInput(0, sop_node)
             geom_settings.setColor(hou.Color((1.0, 0.6, 0.4)))
 
-            primpattern_parm = geom_settings.parm("primpattern")
-            if primpattern_parm:
-                primpattern_parm.set("%type:Boundable")
-
-            treat_ctrl = geom_settings.parm("xn__primvarskarmaobjecttreat_as_lightsource_control_oicfg")
-            treat_toggle = geom_settings.parm("xn__primvarskarmaobjecttreat_as_lightsource_n4bfg")
-            if treat_ctrl and treat_toggle:
-                treat_ctrl.set("set")
-                treat_toggle.set(1)
+            parms = {}
+            if geom_settings.parm("primpattern"):
+                parms["primpattern"] = "%type:Boundable"
+            treat_ctrl = "xn__primvarskarmaobjecttreat_as_lightsource_control_oicfg"
+            treat_toggle = "xn__primvarskarmaobjecttreat_as_lightsource_n4bfg"
+            if geom_settings.parm(treat_ctrl) and geom_settings.parm(treat_toggle):
+                parms[treat_ctrl] = "set"
+                parms[treat_toggle] = 1
+            geom_settings.setParms(parms)
 
             geolight_geom_settings_nodes.append(geom_settings)
             created_nodes.extend([sop_node, geom_settings])
@@ -369,7 +413,7 @@ class CameraSelectorUI(QtWidgets.QWidget):
         # Merge Matte nodes
         matte_merge = None
         if matte_geom_settings_nodes:
-            merge_name = get_unique_name(stage, "MatteMerge")
+            merge_name = get_unique_name("MatteMerge")
             matte_merge = stage.createNode("merge", merge_name)
             for i, node in enumerate(matte_geom_settings_nodes):
                 matte_merge.setInput(i, node)
@@ -379,7 +423,7 @@ class CameraSelectorUI(QtWidgets.QWidget):
         # Merge GeoLight nodes
         geolight_merge = None
         if geolight_geom_settings_nodes:
-            merge_name = get_unique_name(stage, "GeoLightMerge")
+            merge_name = get_unique_name("GeoLightMerge")
             geolight_merge = stage.createNode("merge", merge_name)
             for i, node in enumerate(geolight_geom_settings_nodes):
                 geolight_merge.setInput(i, node)
@@ -387,45 +431,23 @@ class CameraSelectorUI(QtWidgets.QWidget):
             created_nodes.append(geolight_merge)
 
         # Final Merge All node
-        merge_name = get_unique_name(stage, "MergeAll")
+        merge_name = get_unique_name("MergeAll")
         merge_node = stage.createNode("merge", merge_name)
-        idx = 0
-        if scene_import:
-            merge_node.setInput(idx, scene_import)
-            idx += 1
-        for node in render_sop_nodes:
+        merge_inputs = [scene_import] + render_sop_nodes + [matte_merge, geolight_merge]
+        for idx, node in enumerate(n for n in merge_inputs if n):
             merge_node.setInput(idx, node)
-            idx += 1
-        if matte_merge:
-            merge_node.setInput(idx, matte_merge)
-            idx += 1
-        if geolight_merge:
-            merge_node.setInput(idx, geolight_merge)
-            idx += 1
 
         merge_node.setColor(hou.Color((1.0, 1.0, 1.0)))
         created_nodes.append(merge_node)
 
-        # Ask user for Karma Render Settings node name
-        custom_name, ok = QInputDialog.getText(
-            self,
-            "Karma Node Name",
-            "Enter name for Karma Render Settings node:",
-            QtWidgets.QLineEdit.Normal,
-            "KarmaRenderSettings"
-        )
-        if not ok or not custom_name.strip():
-            self.status_label.setText("❌ Node creation cancelled. No Karma node name provided.")
-            return
-        karma_name = custom_name.strip()
-
         karma_node = stage.createNode("karmarenderproperties", karma_name)
+        existing_names.add(karma_node.name())
         karma_node.setInput(0, merge_node)
         karma_node.setPosition(merge_node.position() + hou.Vector2(0, -1.5))
         karma_node.setColor(hou.Color((1.0, 1.0, 1.0)))
         created_nodes.append(karma_node)
 
-        usdrender_name = get_unique_name(stage, "usdrender_rop1")
+        usdrender_name = get_unique_name("usdrender_rop1")
         usdrender_node = stage.createNode("usdrender_rop", usdrender_name)
         usdrender_node.setInput(0, karma_node)
         usdrender_node.setPosition(karma_node.position() + hou.Vector2(0, -1.5))
@@ -439,12 +461,17 @@ class CameraSelectorUI(QtWidgets.QWidget):
 
 def show_camera_selector():
     """Show the CameraSelectorUI window."""
-    global camera_selector_window
-    if camera_selector_window is None:
-        camera_selector_window = CameraSelectorUI()
-    camera_selector_window.show()
-    camera_selector_window.raise_()
-    camera_selector_window.activateWindow()
-
-
-show_camera_selector()
+    # The window is kept on hou.session: the menu execs this file in a fresh
+    # namespace each time, so a module global would never be seen again
+    window = getattr(hou.session, "xlab_camera_selector", None)
+    if window is None or not shiboken2.isValid(window):
+        window = CameraSelectorUI()
+        window.setAttribute(QtCore.Qt.WA_DeleteOnClose, False)
+        hou.session.xlab_camera_selector = window
+    window.show()
+    window.raise_()
+    window.activateWindow()
+
+
+if __name__ == "__main__":
+    show_camera_selector()
@@ -1,7 +1,7 @@
 import hou
 import os
-import subprocess
-import sys
+from PySide2.QtCore import QUrl
+from PySide2.QtGui import QDesktopServices
 
 def open_hip_env_directory():
     hip_path = hou.getenv("HIP")
@@ -14,12 +14,9 @@ def open_hip_env_directory():
     hip_path = os.path.normpath(hip_path)
 
     try:
-        if os.name == "nt":
-            subprocess.Popen(f'explorer "{hip_path}"')
-        elif sys.platform == "darwin":
-            subprocess.Popen(["open", hip_path])
-        else:
-            subprocess.Popen(["xdg-open", hip_path])
+        # Hand the folder to the OS file manager directly, no shell process
+        if not QDesktopServices.openUrl(QUrl.fromLocalFile(hip_path)):
+            hou.ui.displayMessage(f"Failed to open $HIP directory:\n{hip_path}")
     except Exception as e:
         hou.ui.displayMessage(f"Failed to open $HIP directory:\n{str(e)}")
 
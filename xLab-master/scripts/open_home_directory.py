@@ -1,7 +1,7 @@
 import hou
 import os
-import subprocess
-import sys
+from PySide2.QtCore import QUrl
+from PySide2.QtGui import QDesktopServices
 
 def open_HOME_env_directory():
     HOME_path = hou.getenv("HOME")
@@ -14,12 +14,9 @@ def open_HOME_env_directory():
     HOME_path = os.path.normpath(HOME_path)
 
     try:
-        if os.name == "nt":
-            subprocess.Popen(f'explorer "{HOME_path}"')
-        elif sys.platform == "darwin":
-            subprocess.Popen(["open", HOME_path])
-        else:
-            subprocess.Popen(["xdg-open", HOME_path])
+        # Hand the folder to the OS file manager directly, no shell process
+        if not QDesktopServices.openUrl(QUrl.fromLocalFile(HOME_path)):
+            hou.ui.displayMessage(f"Failed to open $HOME directory:\n{HOME_path}")
     except Exception as e:
         hou.ui.displayMessage(f"Failed to open $HOME directory:\n{str(e)}")
 
@@ -1,7 +1,7 @@
 import hou
 import os
-import subprocess
-import sys
+from PySide2.QtCore import QUrl
+from PySide2.QtGui import QDesktopServices
 
 def open_JOB_env_directory():
     JOB_path = hou.getenv("JOB")
@@ -14,12 +14,9 @@ def open_JOB_env_directory():
     JOB_path = os.path.normpath(JOB_path)
 
     try:
-        if os.name == "nt":
-            subprocess.Popen(f'explorer "{JOB_path}"')
-        elif sys.platform == "darwin":
-            subprocess.Popen(["open", JOB_path])
-        else:
-            subprocess.Popen(["xdg-open", JOB_path])
+        # Hand the folder to the OS file manager directly, no shell process
+        if not QDesktopServices.openUrl(QUrl.fromLocalFile(JOB_path)):
+            hou.ui.displayMessage(f"Failed to open $JOB directory:\n{JOB_path}")
     except Exception as e:
         hou.ui.displayMessage(f"Failed to open $JOB directory:\n{str(e)}")
 
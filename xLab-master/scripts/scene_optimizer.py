@@ -1,5 +1,28 @@
+from collections import defaultdict
 from PySide2 import QtWidgets, QtCore
 import hou
+import shiboken2
+
+
+_api_cache = {}
+
+
+def _has_api(node, attr):
+    # hasattr() only depends on the HOM node class, so cache the answer per class
+    key = (type(node), attr)
+    has = _api_cache.get(key)
+    if has is None:
+        has = _api_cache[key] = hasattr(node, attr)
+    return has
+
+
+def _has_flag_api(node):
+    return _has_api(node, "isDisplayFlagSet") and _has_api(node, "isRenderFlagSet")
+
+
+def _ancestor_paths(path):
+    parts = path.split("/")
+    return ["/".join(parts[:i]) for i in range(2, len(parts))]
 
 class SceneOptimizerUI(QtWidgets.QWidget):
     def __init__(self):
@@ -43,22 +66,120 @@ class SceneOptimizerUI(QtWidgets.QWidget):
 
         self.run_btn.clicked.connect(self.run_optimization)
 
+        # Collects log lines during a run; flushed to output_text in one update
+        self._log_buffer = None
+
     def log(self, msg):
+        if self._log_buffer is not None:
+            self._log_buffer.append(msg)
+            return
         self.output_text.append(msg)
         print(msg)
 
-    def node_has_display_or_render_flag(self, node):
-        if hasattr(node, "isDisplayFlagSet") and hasattr(node, "isRenderFlagSet"):
+    def flush_log(self):
+        text = "\n".join(self._log_buffer)
+        self._log_buffer = None
+        self.output_text.setPlainText(text)
+        print(text)
+
+    def node_has_display_or_render_flag(self, node, flagged=None):
+        if flagged is not None:
+            # flagged: session ids of nodes with a display/render flag set (see collect_nodes)
+            if node.sessionId() in flagged:
+                return True
+            return any(child.sessionId() in flagged for child in node.children())
+        if _has_flag_api(node):
             if node.isDisplayFlagSet() or node.isRenderFlagSet():
                 return True
         for child in node.children():
-            if hasattr(child, "isDisplayFlagSet") and hasattr(child, "isRenderFlagSet"):
+            if _has_flag_api(child):
                 if child.isDisplayFlagSet() or child.isRenderFlagSet():
                     return True
         return False
 
+    def collect_nodes(self, obj):
+        """Walk /obj once; return editable nodes and the session ids of flagged nodes."""
+        all_sub = obj.allSubChildren()
+        all_nodes = [n for n in all_sub if not n.isInsideLockedHDA()]
+        flagged = set()
+        for n in all_sub:
+            if _has_flag_api(n):
+                if n.isDisplayFlagSet() or n.isRenderFlagSet():
+                    flagged.add(n.sessionId())
+        return all_nodes, flagged
+
+    def collect_referenced_paths(self):
+        """Scan every parm in the scene once; return the node paths something refers to."""
+        referenced = set()
+        for node in hou.node("/").allSubChildren():
+            src = node.path()
+            for parm in node.parms():
+                targets = []
+                try:
+                    ref = parm.getReferencedParm()
+                    if ref != parm:
+                        targets.append(ref.node().path())
+                except hou.Error:
+                    pass
+                # Separate try so a failing string eval doesn't drop the channel reference
+                try:
+                    if parm.parmTemplate().type() == hou.parmTemplateType.String:
+                        value = parm.evalAsString()
+                        if value.startswith("op:"):
+                            value = value[3:]
+                        # Resolve relative to the node so "../shop/mat" counts too
+                        target = node.node(value) if value else None
+                        if target is not None:
+                            targets.append(target.path())
+                except hou.Error:
+                    pass
+                for tgt in targets:
+                    # references from inside the target itself don't count as usage
+                    if src == tgt or src.startswith(tgt + "/"):
+                        continue
+                    referenced.add(tgt)
+                    referenced.update(_ancestor_paths(tgt))
+        return referenced
+
+    def delete_nodes_batched(self, nodes):
+        """Delete nodes with one deleteItems() call per parent; returns the deleted paths."""
+        by_path = {n.path(): n for n in nodes}
+        buckets = defaultdict(list)
+        for path, node in by_path.items():
+            # nodes under another node being deleted go away with it
+            if any(a in by_path for a in _ancestor_paths(path)):
+                continue
+            buckets[node.parent()].append(node)
+
+        deleted_roots = set()
+        with hou.undos.group("Scene Optimizer: Delete Nodes"), hou.RedrawBlock():
+            for parent, items in buckets.items():
+                item_paths = [n.path() for n in items]
+                try:
+                    parent.deleteItems(items)
+                    deleted_roots.update(item_paths)
+                except Exception as e:
+                    self.log(f"Failed to delete {', '.join(item_paths)}: {e}")
+
+        return [
+            path for path in by_path
+            if path in deleted_roots or any(a in deleted_roots for a in _ancestor_paths(path))
+        ]
+
     def run_optimization(self):
         self.output_text.clear()
+        self._log_buffer = []
+        # Hold cooks and viewport redraws until every pass has run
+        prev_mode = hou.updateModeSetting()
+        hou.setUpdateMode(hou.updateMode.Manual)
+        try:
+            with hou.undos.group("Scene Optimization"), hou.RedrawBlock():
+                self._run_passes()
+        finally:
+            hou.setUpdateMode(prev_mode)
+            self.flush_log()
+
+    def _run_passes(self):
         self.log("Starting Houdini Scene Optimization...\n")
 
         deleted_nodes = []
@@ -71,105 +192,113 @@ class SceneOptimizerUI(QtWidgets.QWidget):
             self.log("No /obj context found. Aborting.")
             return
 
+        do_unused = self.delete_unused_nodes_cb.isChecked()
+        do_caches = self.clear_geometry_caches_cb.isChecked()
+        do_flags = self.clean_display_flags_cb.isChecked()
+        do_nulls = self.delete_nulls_cb.isChecked()
+        do_freeze = self.freeze_animated_cb.isChecked()
+
+        # One walk over /obj gathers the work for every enabled pass; the
+        # mutations are applied afterwards. Paths are recorded up front since
+        # HOM objects can't be queried once deleted.
+        all_nodes, flagged = self.collect_nodes(obj)
+        unused = []
+        null_candidates = []
+        cache_parms = []
+        subnets = []
+        freeze_parms = []
+        for node in all_nodes:
+            path = node.path()
+            tname = node.type().name()
+            outputs = node.outputs()
+            if do_unused and not outputs and not self.node_has_display_or_render_flag(node, flagged):
+                unused.append(node)
+            if do_nulls and tname == "null" and not node.inputs():
+                null_candidates.append((path, node, [out.path() for out in outputs]))
+            if do_caches and tname == "geo":
+                cache_parm = node.parm("cachepath")
+                if cache_parm and cache_parm.eval():
+                    cache_parms.append((path, cache_parm))
+            if do_flags and tname == "subnet":
+                subnets.append((path, node))
+            if do_freeze:
+                # keyframes() is a stored-list lookup; isTimeDependent() walks expressions.
+                # Channel expressions are keyframes too, so nothing animated is skipped.
+                for parm in node.parms():
+                    if parm.keyframes():
+                        freeze_parms.append((path, parm))
+
         # 1. Delete unused nodes safely
-        if self.delete_unused_nodes_cb.isChecked():
+        if do_unused:
             self.log("Deleting unused nodes...")
-            nodes_to_delete = []
-            for node in obj.allSubChildren():
-                if node.isInsideLockedHDA():
-                    continue
-                if len(node.outputs()) == 0 and not self.node_has_display_or_render_flag(node):
-                    nodes_to_delete.append(node)
-
-            for node in nodes_to_delete:
-                try:
-                    path = node.path()
-                    node.destroy()
-                    deleted_nodes.append(path)
-                except Exception as e:
-                    self.log(f"Failed to delete {node.path()}: {e}")
+            deleted_nodes.extend(self.delete_nodes_batched(unused))
 
         # 2. Delete unused materials
         if self.delete_unused_materials_cb.isChecked():
             self.log("Deleting unused materials...")
             shop = hou.node("/shop")
             if shop:
-                for mat in shop.children():
-                    refs = hou.parmReferences(mat)
-                    if not refs:
-                        try:
-                            path = mat.path()
-                            mat.destroy()
-                            deleted_materials.append(path)
-                        except Exception as e:
-                            self.log(f"Failed to delete material {mat.path()}: {e}")
+                referenced = self.collect_referenced_paths()
+                unused_materials = [mat for mat in shop.children() if mat.path() not in referenced]
+                deleted_materials.extend(self.delete_nodes_batched(unused_materials))
             else:
                 self.log("No /shop context found.")
 
+        gone = set(deleted_nodes)
+
+        def alive(path):
+            return path not in gone and not any(a in gone for a in _ancestor_paths(path))
+
         # 3. Clear geometry caches
-        if self.clear_geometry_caches_cb.isChecked():
+        if do_caches:
             self.log("Clearing geometry caches...")
-            for geo_node in obj.children():
-                if geo_node.type().name() == "geo":
-                    cache_parm = geo_node.parm("cachepath")
-                    if cache_parm:
-                        cache_path = cache_parm.eval()
-                        if cache_path:
-                            try:
-                                cache_parm.deleteAllKeyframes()
-                                cache_parm.set("")
-                                cleared_caches.append(geo_node.path())
-                            except Exception as e:
-                                self.log(f"Failed clearing cache on {geo_node.path()}: {e}")
+            for path, cache_parm in cache_parms:
+                if not alive(path):
+                    continue
+                try:
+                    cache_parm.deleteAllKeyframes()
+                    cache_parm.set("")
+                    cleared_caches.append(path)
+                except Exception as e:
+                    self.log(f"Failed clearing cache on {path}: {e}")
 
         # 4. Clean display/render flags on subnet nodes
-        if self.clean_display_flags_cb.isChecked():
+        if do_flags:
             self.log("Cleaning display/render flags on subnet nodes...")
-            for node in obj.allSubChildren():
-                if node.isInsideLockedHDA():
+            for path, node in subnets:
+                if not alive(path):
                     continue
-                if node.type().name() == "subnet":
-                    for child in node.children():
-                        if hasattr(child, "isDisplayFlagSet") and child.isDisplayFlagSet():
-                            child.setDisplayFlag(False)
-                            cleaned_flags.append(f"Removed display flag from {child.path()}")
-                        if hasattr(child, "isRenderFlagSet") and child.isRenderFlagSet():
-                            child.setRenderFlag(False)
-                            cleaned_flags.append(f"Removed render flag from {child.path()}")
+                for child in node.children():
+                    if _has_api(child, "isDisplayFlagSet") and child.isDisplayFlagSet():
+                        child.setDisplayFlag(False)
+                        cleaned_flags.append(f"Removed display flag from {child.path()}")
+                    if _has_api(child, "isRenderFlagSet") and child.isRenderFlagSet():
+                        child.setRenderFlag(False)
+                        cleaned_flags.append(f"Removed render flag from {child.path()}")
 
         # 5. Delete null nodes with no connections safely
-        if self.delete_nulls_cb.isChecked():
+        if do_nulls:
             self.log("Deleting null nodes with no connections...")
-            nulls_to_delete = []
-            for node in obj.allSubChildren():
-                if node.isInsideLockedHDA():
-                    continue
-                if node.type().name() == "null":
-                    if not node.inputs() and not node.outputs():
-                        nulls_to_delete.append(node)
-
-            for node in nulls_to_delete:
-                try:
-                    path = node.path()
-                    node.destroy()
-                    deleted_nodes.append(path)
-                except Exception as e:
-                    self.log(f"Failed to delete null node {node.path()}: {e}")
+            # A null whose outputs were all removed in step 1 is now unconnected too
+            nulls_to_delete = [
+                node for path, node, out_paths in null_candidates
+                if alive(path) and not any(alive(out) for out in out_paths)
+            ]
+            deleted_nodes.extend(self.delete_nodes_batched(nulls_to_delete))
+            gone.update(deleted_nodes)
 
         # 6. Freeze animated parameters (delete keyframes)
-        if self.freeze_animated_cb.isChecked():
+        if do_freeze:
             self.log("Freezing animated parameters...")
-            for node in obj.allSubChildren():
-                if node.isInsideLockedHDA():
+            for path, parm in freeze_parms:
+                if not alive(path):
                     continue
-                for parm in node.parms():
-                    if parm.isTimeDependent():
-                        try:
-                            val = parm.eval()
-                            parm.deleteAllKeyframes()
-                            parm.set(val)
-                        except Exception as e:
-                            self.log(f"Failed freezing parm {parm.name()} on {node.path()}: {e}")
+                try:
+                    val = parm.eval()
+                    parm.deleteAllKeyframes()
+                    parm.set(val)
+                except Exception as e:
+                    self.log(f"Failed freezing parm {parm.name()} on {path}: {e}")
 
         # Summary
         self.log("\nOptimization Complete.\n")
@@ -189,14 +318,16 @@ class SceneOptimizerUI(QtWidgets.QWidget):
 
 
 def show_optimizer():
-    global _optimizer_ui
-    try:
-        _optimizer_ui.close()
-        _optimizer_ui.deleteLater()
-    except:
-        pass
-    _optimizer_ui = SceneOptimizerUI()
-    _optimizer_ui.show()
+    # Reuse the existing window instead of rebuilding it on every launch. It is
+    # kept on hou.session since the menu re-executes this file in a new namespace.
+    ui = getattr(hou.session, "xlab_scene_optimizer", None)
+    if ui is None or not shiboken2.isValid(ui):
+        ui = SceneOptimizerUI()
+        ui.setAttribute(QtCore.Qt.WA_DeleteOnClose, False)
+        hou.session.xlab_scene_optimizer = ui
+    ui.show()
+    ui.raise_()
+    ui.activateWindow()
 
 try:
     show_optimizer()
@@ -1,5 +1,14 @@
 from PySide2 import QtWidgets, QtCore
 import hou
+import shiboken2
+
+# Resolution parm names in priority order; the first set a node has wins
+PARAMS_TO_TRY = (
+    ("resx", "resy"),
+    ("width", "height"),
+    ("resx_override", "resy_override"),
+    ("vm_resolution",),
+)
 
 class ResolutionSetter(QtWidgets.QWidget):
     def __init__(self):
@@ -13,12 +22,9 @@ class ResolutionSetter(QtWidgets.QWidget):
         form_layout = QtWidgets.QFormLayout()
         layout.addLayout(form_layout)
 
-        # Load saved or default resolution
-        default_width = getattr(hou.session, "saved_res_width", 2048)
-        default_height = getattr(hou.session, "saved_res_height", 1080)
-
-        self.width_edit = QtWidgets.QLineEdit(str(default_width))
-        self.height_edit = QtWidgets.QLineEdit(str(default_height))
+        # Filled from the saved or default resolution in showEvent
+        self.width_edit = QtWidgets.QLineEdit()
+        self.height_edit = QtWidgets.QLineEdit()
         form_layout.addRow("Width:", self.width_edit)
         form_layout.addRow("Height:", self.height_edit)
 
@@ -31,52 +37,58 @@ class ResolutionSetter(QtWidgets.QWidget):
 
         self.set_button.clicked.connect(self.on_set_resolution)
 
+    def showEvent(self, event):
+        # The window is reused, so reload the saved resolution each time it opens.
+        # Spontaneous shows (restore from minimized) keep whatever the user typed.
+        super(ResolutionSetter, self).showEvent(event)
+        if event.spontaneous():
+            return
+        self.width_edit.setText(str(getattr(hou.session, "saved_res_width", 2048)))
+        self.height_edit.setText(str(getattr(hou.session, "saved_res_height", 1080)))
+
     def on_set_resolution(self):
-        try:
-            width = int(self.width_edit.text())
-            height = int(self.height_edit.text())
-        except ValueError:
+        width_text = self.width_edit.text().strip()
+        height_text = self.height_edit.text().strip()
+        if not (width_text.isdecimal() and height_text.isdecimal()):
             hou.ui.displayMessage("Please enter valid integer values for width and height.")
             return
+        width, height = int(width_text), int(height_text)
 
         selected_nodes = hou.selectedNodes()
         if not selected_nodes:
             hou.ui.displayMessage("No node selected.")
             return
 
-        params_to_try = [
-            ("resx", "resy"),
-            ("width", "height"),
-            ("resx_override", "resy_override"),
-            ("vm_resolution",),
-        ]
-
         def set_params_on_node(node):
-            changed = False
-            for names in params_to_try:
+            get_parm = node.parm
+            for names in PARAMS_TO_TRY:
                 if len(names) == 2:
-                    if node.parm(names[0]) and node.parm(names[1]):
-                        node.parm(names[0]).set(width)
-                        node.parm(names[1]).set(height)
-                        changed = True
-                elif len(names) == 1:
-                    parm = node.parm(names[0])
+                    if get_parm(names[0]) and get_parm(names[1]):
+                        node.setParms({names[0]: width, names[1]: height})
+                        return True
+                else:
+                    parm = get_parm(names[0])
                     if parm and parm.isVector():
                         parm.set((width, height))
-                        changed = True
-            return changed
+                        return True
+            return False
 
-        def recurse_and_set(node):
+        def recurse_and_set(root):
+            # Explicit stack: no Python frame per node and no recursion limit on deep subnets
             total_changed = 0
-            if set_params_on_node(node):
-                total_changed += 1
-            for child in node.children():
-                total_changed += recurse_and_set(child)
+            stack = [root]
+            while stack:
+                node = stack.pop()
+                if set_params_on_node(node):
+                    total_changed += 1
+                stack.extend(node.children())
             return total_changed
 
         total_nodes_changed = 0
-        for node in selected_nodes:
-            total_nodes_changed += recurse_and_set(node)
+        # One undo entry for the whole selection rather than one per parm
+        with hou.undos.group("Set Resolution"):
+            for node in selected_nodes:
+                total_nodes_changed += recurse_and_set(node)
 
         if self.save_checkbox.isChecked():
             hou.session.saved_res_width = width
@@ -88,13 +100,15 @@ class ResolutionSetter(QtWidgets.QWidget):
             hou.ui.displayMessage("No nodes with recognized resolution parameters found in selection or children.")
 
 def show_resolution_setter():
-    global _resolution_setter_win
-    try:
-        _resolution_setter_win.close()
-        _resolution_setter_win.deleteLater()
-    except:
-        pass
-    _resolution_setter_win = ResolutionSetter()
-    _resolution_setter_win.show()
+    # Reuse the existing window instead of rebuilding it on every launch. It is
+    # kept on hou.session since the menu re-executes this file in a new namespace.
+    win = getattr(hou.session, "xlab_resolution_setter", None)
+    if win is None or not shiboken2.isValid(win):
+        win = ResolutionSetter()
+        win.setAttribute(QtCore.Qt.WA_DeleteOnClose, False)
+        hou.session.xlab_resolution_setter = win
+    win.show()
+    win.raise_()
+    win.activateWindow()
 
 show_resolution_setter()
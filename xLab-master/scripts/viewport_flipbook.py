@@ -3,7 +3,8 @@ import os
 import re
 import sys
 import subprocess
-import toolutils
+from collections import deque
+from pathlib import Path
 from PySide2 import QtWidgets, QtCore
 
 
@@ -19,16 +20,54 @@ def get_ffmpeg_bin():
     return ffmpeg
 
 
+# Hardware H.264 encoders in order of preference, with settings for review-quality output
+_HW_ENCODERS = (
+    # -b:v 0 lifts nvenc's default bitrate cap so -cq alone drives quality
+    ("h264_nvenc", ["-preset", "p7", "-cq", "18", "-b:v", "0", "-pix_fmt", "yuv420p"]),
+    ("h264_qsv", ["-global_quality", "18", "-pix_fmt", "nv12"]),
+    ("h264_videotoolbox", ["-b:v", "20M", "-pix_fmt", "yuv420p"]),
+)
+_X264_ARGS = ["-c:v", "libx264", "-preset", "medium", "-crf", "18", "-pix_fmt", "yuv420p"]
+
+
+def get_video_encoder_args(ffmpeg):
+    # Encoder candidates for this ffmpeg build: hardware first, libx264 last.
+    # The probe result lives on hou.session since this script is re-executed per launch.
+    probed = getattr(hou.session, "xlab_ffmpeg_encoders", {})
+    available = probed.get(ffmpeg)
+    if available is None:
+        try:
+            result = subprocess.run([ffmpeg, "-hide_banner", "-encoders"], capture_output=True, text=True)
+            available = result.stdout
+        except OSError:
+            available = ""
+        probed[ffmpeg] = available
+        hou.session.xlab_ffmpeg_encoders = probed
+    candidates = [["-c:v", name] + args for name, args in _HW_ENCODERS if f" {name} " in available]
+    candidates.append(_X264_ARGS)
+    return candidates
+
+
+def run_ffmpeg(cmd):
+    # Read output as it arrives so a long encode can't fill the pipe; keep only the tail for errors
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace")
+    tail = deque(maxlen=200)
+    for line in proc.stdout:
+        tail.append(line)
+    proc.wait()
+    return proc.returncode, "".join(tail)
+
+
+_VERSION_RE = re.compile(r"^V(\d{3,})$")
+
+
 def find_next_version(base_folder):
-    if not os.path.exists(base_folder):
+    if not os.path.isdir(base_folder):
         return "V001"
-    versions = [v for v in os.listdir(base_folder) if re.match(r"V\d{3}", v)]
-    if not versions:
-        return "V001"
-    versions.sort()
-    last = versions[-1]
-    next_num = int(last[1:]) + 1
-    return f"V{next_num:03}"
+    with os.scandir(base_folder) as it:
+        nums = [int(m.group(1)) for entry in it
+                for m in (_VERSION_RE.match(entry.name),) if m]
+    return f"V{(max(nums) + 1) if nums else 1:03}"
 
 
 # --------- Dialog --------- #
@@ -46,11 +85,14 @@ class FlipbookDialog(QtWidgets.QDialog):
         self.version_edit = QtWidgets.QLineEdit(version)
         self.open_checkbox = QtWidgets.QCheckBox("Open MP4 After Render")
         self.open_checkbox.setChecked(False)
+        self.keep_exr_checkbox = QtWidgets.QCheckBox("Keep EXR Frames")
+        self.keep_exr_checkbox.setChecked(True)
 
         layout.addRow("Start Frame:", self.start_edit)
         layout.addRow("End Frame:", self.end_edit)
         layout.addRow("Version:", self.version_edit)
         layout.addRow("", self.open_checkbox)
+        layout.addRow("", self.keep_exr_checkbox)
 
         btn_layout = QtWidgets.QHBoxLayout()
         self.ok_btn = QtWidgets.QPushButton("Flipbook")
@@ -76,13 +118,17 @@ class FlipbookDialog(QtWidgets.QDialog):
             int(self.start_edit.text()),
             int(self.end_edit.text()),
             self.version_edit.text().strip(),
-            self.open_checkbox.isChecked()
+            self.open_checkbox.isChecked(),
+            self.keep_exr_checkbox.isChecked()
         )
 
 
 # --------- Main --------- #
 
 def main():
+    # Imported here so loading this module for its helpers doesn't pull in toolutils
+    import toolutils
+
     # Prepare context
     hipfile = hou.hipFile.path()
     if not hipfile:
@@ -105,7 +151,7 @@ def main():
     if not dialog.exec_():
         return  # Cancelled
 
-    start_frame, end_frame, version_str, open_after = dialog.get_values()
+    start_frame, end_frame, version_str, open_after, keep_exr = dialog.get_values()
 
     # Scene Viewer & Camera
     viewer = toolutils.sceneViewer()
@@ -114,13 +160,15 @@ def main():
     if not camera:
         raise hou.Error("Please lock a camera to the viewport.")
 
-    resx = int(camera.parm("resx").eval())
-    resy = int(camera.parm("resy").eval())
+    # resx/resy are the components of the camera's "res" parm tuple
+    resx, resy = (int(v) for v in camera.evalParmTuple("res"))
 
     # Setup output
     version_folder = os.path.join(flipbook_dir, version_str)
     os.makedirs(version_folder, exist_ok=True)
-    image_pattern = os.path.join(version_folder, f"{hip_name}_{version_str}.$F4.exr")
+    # Without EXRs to keep, write 8-bit PNGs: far cheaper to write and for ffmpeg to decode
+    frame_ext = "exr" if keep_exr else "png"
+    image_pattern = os.path.join(version_folder, f"{hip_name}_{version_str}.$F4.{frame_ext}")
 
     # Flipbook settings
     settings = viewer.flipbookSettings()
@@ -139,28 +187,37 @@ def main():
     try:
         ffmpeg = get_ffmpeg_bin()
 
-        mp4_dir = os.path.normpath(os.path.join(flipbook_dir, "mp4"))
-        os.makedirs(mp4_dir, exist_ok=True)
+        # Path normalizes separators once; ffmpeg gets plain strings
+        mp4_dir = Path(flipbook_dir) / "mp4"
+        mp4_dir.mkdir(parents=True, exist_ok=True)
 
-        exr_seq = os.path.normpath(os.path.join(version_folder, f"{hip_name}_{version_str}.%04d.exr"))
-        mp4_path = os.path.normpath(os.path.join(mp4_dir, f"{hip_name}.{version_str}.mp4"))
+        frame_seq = str(Path(version_folder) / f"{hip_name}_{version_str}.%04d.{frame_ext}")
+        mp4_path = str(mp4_dir / f"{hip_name}.{version_str}.mp4")
 
-        cmd = [
+        input_args = [
             ffmpeg,
             "-y",
             "-start_number", str(start_frame),
             "-framerate", "24",
-            "-i", exr_seq,
-            "-c:v", "libx264",
-            "-preset", "veryslow",
-            "-crf", "0",  # Lossless CRF
-            "-pix_fmt", "yuv444p",  # Full chroma (optional, if source supports it)
-            mp4_path
+            "-i", frame_seq,
+            # 4:2:0 output needs even dimensions; crop off the odd row/column rather than resample
+            "-vf", "crop=trunc(iw/2)*2:trunc(ih/2)*2",
         ]
 
-        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        if result.returncode != 0:
-            raise hou.Error("FFmpeg failed:\n" + result.stderr.decode())
+        # An encoder can be listed but still fail (no GPU / driver), so fall through to the next
+        for encoder_args in get_video_encoder_args(ffmpeg):
+            returncode, output = run_ffmpeg(input_args + encoder_args + [mp4_path])
+            if returncode == 0:
+                break
+        else:
+            raise hou.Error("FFmpeg failed:\n" + output)
+
+        if not keep_exr:
+            # The version folder itself stays so find_next_version keeps counting up
+            for frame in range(start_frame, end_frame + 1):
+                frame_path = os.path.join(version_folder, f"{hip_name}_{version_str}.{frame:04d}.png")
+                if os.path.exists(frame_path):
+                    os.remove(frame_path)
 
         if open_after:
             if sys.platform == "win32":
@@ -174,4 +231,5 @@ def main():
         hou.ui.displayMessage(f"Flipbook succeeded, but MP4 creation failed:\n{e}")
 
 
-main()
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import hou
 import os
+import json
 import getpass
 from datetime import datetime
 
@@ -23,30 +24,8 @@ username = getpass.getuser()
 # Collect selected node names (joined by _)
 node_names = "_".join([n.name() for n in nodes])
 
-# Create a subnet at the same level
+# Subnet name doubles as the HDA name
 subnet_name = f"{node_names}_{namespace}_{username}"
-subnet = parent.createNode("subnet", subnet_name)
-
-# Dictionary to map original node -> copied node
-node_map = {}
-
-# Copy nodes into the subnet
-for node in nodes:
-    copied = node.copyTo(subnet)
-    copied.setName(node.name(), unique_name=True)
-    copied.moveToGoodPosition()
-    node_map[node] = copied
-
-# Recreate connections inside the subnet
-for node in nodes:
-    copied_node = node_map[node]
-    for i in range(len(node.inputs())):
-        input_node = node.input(i)
-        if input_node in node_map:
-            copied_node.setInput(i, node_map[input_node])
-
-# Layout subnet contents
-subnet.layoutChildren()
 
 # Prepare export path
 xlab_path = os.environ.get("XLAB")
@@ -58,18 +37,34 @@ os.makedirs(export_dir, exist_ok=True)
 # Define HDA path
 hda_path = os.path.join(export_dir, subnet_name + ".hda")
 
-# Create HDA from the subnet and ignore external references
-subnet.createDigitalAsset(
-    name=subnet_name,
-    hda_file_name=hda_path,
-    description="Exported multiple nodes via script (with connections)",
-    ignore_external_references=True
-)
-
-# Delete subnet by name (not by reference)
-subnet_node = parent.node(subnet_name)
-if subnet_node:
-    subnet_node.destroy()
+# The subnet only exists for the export, so skip undo recording for it
+with hou.undos.disabler():
+    # Create a subnet at the same level
+    subnet = parent.createNode("subnet", subnet_name)
+
+    # Copy nodes into the subnet in one batch; names and wires between the
+    # selected nodes are kept since the subnet starts empty
+    hou.copyNodesTo(nodes, subnet)
+
+    # Layout subnet contents
+    subnet.layoutChildren()
+
+    # Create HDA from the subnet and ignore external references
+    subnet.createDigitalAsset(
+        name=subnet_name,
+        hda_file_name=hda_path,
+        description="Exported multiple nodes via script (with connections)",
+        ignore_external_references=True
+    )
+
+    # Delete subnet by name (not by reference)
+    subnet_node = parent.node(subnet_name)
+    if subnet_node:
+        subnet_node.destroy()
+
+# Record where the nodes came from so xPaste doesn't have to guess from the filename
+with open(hda_path + ".json", "w") as fp:
+    json.dump({"parent_path": parent.path(), "namespace": namespace}, fp)
 
 print(f"HDA exported to: {hda_path}")
 print(f"Subnet {subnet_name} destroyed after export.")
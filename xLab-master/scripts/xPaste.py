@@ -1,5 +1,6 @@
 import hou
 import os
+import json
 import time
 
 # ---------------------------
@@ -9,17 +10,14 @@ import time
 xlab_path = os.environ.get("XLAB")
 hda_dir = os.path.join(xlab_path, "nodedata")
 
-# Collect .hda files with timestamps
-hda_files = [
-    (f, os.path.getmtime(os.path.join(hda_dir, f)))
-    for f in os.listdir(hda_dir) if f.endswith(".hda")
-]
+# Collect .hda files with timestamps, newest first (scandir entries carry their stat)
+with os.scandir(hda_dir) as it:
+    hda_files = sorted(
+        ((e.name, e.stat().st_mtime) for e in it if e.name.endswith(".hda")),
+        key=lambda x: x[1], reverse=True)
 if not hda_files:
     raise Exception("No HDA files found in folder.")
 
-# Sort newest first
-hda_files.sort(key=lambda x: x[1], reverse=True)
-
 # Build display list: filename + timestamp
 hda_display_list = [
     f"{fname}   [{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(mtime))}]"
@@ -36,10 +34,23 @@ selected_hda = hda_files[selected_index[0]][0]
 hda_path = os.path.join(hda_dir, selected_hda)
 
 # ---------------------------
-# 2. Install HDA temporarily
+# 2. Install HDA for this session
 # ---------------------------
 
-hou.hda.installFile(hda_path)
+# Installing rebuilds the node type registry, so only do it once per file per
+# session (reloading if the file changed), and keep it out of OPlibraries so
+# it's gone after a restart
+hda_key = os.path.normcase(os.path.normpath(hda_path))
+hda_mtime = os.path.getmtime(hda_path)
+# mtime of each file when last (re)loaded; xCopy rewrites files under the same name
+pasted_mtimes = getattr(hou.session, "xlab_pasted_hda_mtimes", {})
+loaded = {os.path.normcase(os.path.normpath(f)) for f in hou.hda.loadedFiles()}
+if hda_key not in loaded:
+    hou.hda.installFile(hda_path, change_oplibraries_file=False)
+elif pasted_mtimes.get(hda_key) != hda_mtime:
+    hou.hda.reloadFile(hda_path)
+pasted_mtimes[hda_key] = hda_mtime
+hou.session.xlab_pasted_hda_mtimes = pasted_mtimes
 definitions = hou.hda.definitionsInFile(hda_path)
 if not definitions:
     raise Exception("No definitions found in HDA file")
@@ -48,67 +59,56 @@ hda_def = definitions[0]
 node_type_name = hda_def.nodeTypeName()
 
 # ---------------------------
-# 3. Detect parent network from filename
+# 3. Detect parent network from the xCopy sidecar
 # ---------------------------
 
-parts = selected_hda.split("_")
-
-# Scan each part of filename to find a valid network
 parent = None
-for part in parts:
-    candidate = hou.node("/" + part)
-    if candidate:
-        parent = candidate
-        break
+try:
+    with open(hda_path + ".json") as fp:
+        meta = json.load(fp)
+    parent = hou.node(meta["parent_path"])
+except (OSError, ValueError, KeyError):
+    # HDAs exported before the sidecar existed: scan the filename for a valid network
+    for part in selected_hda.split("_"):
+        candidate = hou.node("/" + part)
+        if candidate:
+            parent = candidate
+            break
 
 if parent is None:
     parent = hou.node("/obj")
-    print("No matching namespace found in filename, using /obj instead.")
+    print("Original network not found, using /obj instead.")
 
 # ---------------------------
 # 4. Create HDA node
 # ---------------------------
 
-hda_node = parent.createNode(node_type_name)
-hda_node.moveToGoodPosition()
-print(f"HDA loaded and node created: {hda_node.path()}")
-
-# ---------------------------
-# 5. Unlock and extract internal nodes with connections
-# ---------------------------
-
-hda_node.allowEditingOfContents()
-internal_nodes = hda_node.children()
-
-if not internal_nodes:
-    print("HDA is empty, nothing to copy.")
-else:
-    # Map original node -> copied node
-    node_map = {}
-    for n in internal_nodes:
-        copied = n.copyTo(parent)
-        copied.moveToGoodPosition()
-        node_map[n] = copied
+# Import as a single undo step
+with hou.undos.group("xPaste"):
+    hda_node = parent.createNode(node_type_name)
+    hda_node.moveToGoodPosition()
+    print(f"HDA loaded and node created: {hda_node.path()}")
 
-    # Recreate connections
-    for orig_node in internal_nodes:
-        copied_node = node_map[orig_node]
-        for i, input_node in enumerate(orig_node.inputs()):
-            if input_node in node_map:
-                copied_node.setInput(i, node_map[input_node])
+    # ---------------------------
+    # 5. Unlock and extract internal nodes with connections
+    # ---------------------------
 
-    print(f"Copied {len(internal_nodes)} nodes with connections to {parent.path()}.")
+    hda_node.allowEditingOfContents()
+    internal_nodes = hda_node.children()
 
-# ---------------------------
-# 6. Delete original HDA node
-# ---------------------------
+    if not internal_nodes:
+        print("HDA is empty, nothing to copy.")
+    else:
+        # Move rather than copy: the HDA node is destroyed right after, and wires
+        # between the moved nodes are carried over
+        moved = hou.moveNodesTo(internal_nodes, parent)
+        parent.layoutChildren(moved)
 
-hda_node.destroy()
-print("Original HDA node deleted.")
+        print(f"Moved {len(moved)} nodes with connections to {parent.path()}.")
 
-# ---------------------------
-# 7. Uninstall HDA definition (so it's not permanently available)
-# ---------------------------
+    # ---------------------------
+    # 6. Delete original HDA node
+    # ---------------------------
 
-hou.hda.uninstallFile(hda_path)
-print(f"HDA {selected_hda} uninstalled after import.")
+    hda_node.destroy()
+    print("Original HDA node deleted.")